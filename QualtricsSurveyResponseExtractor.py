@@ -2,7 +2,7 @@
 """
 Qualtrics → Box (merge multiple surveys into ONE CSV) — requests-only
 
-- For each Survey ID:
+- For each Survey ID (exported concurrently):
     1) Export responses (CSV in ZIP)
     2) Clean: keep header, drop rows 2 & 3, remove {"ImportId":"finished"}
 - Merge all surveys into a single CSV:
@@ -14,15 +14,38 @@ Qualtrics → Box (merge multiple surveys into ONE CSV) — requests-only
 
 Requirements:
     pip install requests
+    pip install orjson   # optional, faster JSON parsing of API responses
 """
 
 import io
 import csv
+import json
+import re
 import time
+import zlib
+import queue
+import codecs
+import struct
+import base64
+import hashlib
+import threading
+import shutil
 import zipfile
+import tempfile
 import datetime
+import operator
+import itertools
 import requests
-from typing import Optional, Tuple, List, Dict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import IO, Iterable, Iterator, Optional, Sequence, Tuple, List, Dict
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # optional
+    _json_loads = json.loads
 
 # ======================== CONFIG ========================
 
@@ -40,92 +63,257 @@ BOX_FOLDER_ID = "xxx"  # "0" root or your folder ID like "347751241234"
 
 # ==================== END CONFIG ========================
 
+# Export polling: exponential backoff so quick exports return fast and long
+# ones don't hammer the API
+POLL_INITIAL_DELAY = 0.3   # seconds
+POLL_BACKOFF_BASE = 1.3
+POLL_MAX_DELAY = 5.0       # seconds
+POLL_TIMEOUT = 600         # seconds
+
+# Export ZIPs and the merged CSV are kept in memory up to this size, then
+# spill to a temp file
+SPOOL_MAX_SIZE = 64 << 20
+
+# Export download: read in 64 KiB chunks; at most ~16 MiB downloaded but not
+# yet parsed is held in the queue between the download and parsing threads
+ZIP_CHUNK_SIZE = 1 << 16
+ZIP_QUEUE_CHUNKS = 256
+
+# Surveys exported at the same time
+MAX_WORKERS = 8
+
+# Shared across threads so connections (and TLS sessions) are pooled; the pool
+# covers every export worker plus Box part uploads, so each survey's polls and
+# its download reuse one keep-alive socket. Idempotent calls are retried on
+# throttling / gateway errors (Retry-After is honored); POSTs are not.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=max(16, MAX_WORKERS),
+    max_retries=Retry(total=5, backoff_factor=0.3,
+                      status_forcelist=[429, 502, 503, 504], raise_on_status=False),
+))
+SESSION.headers.update({"Accept-Encoding": "gzip, deflate"})
+
 
 # ---------- Qualtrics helpers ----------
+# Narrowest CSV the merge needs: labels, no display-order columns. The v3 API
+# always adds the two description rows and the ImportId footer, so the
+# cleaning step stays.
+Q_EXPORT_PAYLOAD = {"format": "csv", "compress": True, "useLabels": True, "includeDisplayOrder": False}
+
 def q_base_url(survey_id: str) -> str:
     return f"https://{DATACENTER}.qualtrics.com/API/v3/surveys/{survey_id}/export-responses"
 
-def q_headers() -> dict:
-    return {"X-API-TOKEN": QUALTRICS_API_TOKEN, "Content-Type": "application/json"}
+# Built once from the config above; requests copies headers per call
+Q_HEADERS = {"X-API-TOKEN": QUALTRICS_API_TOKEN, "Content-Type": "application/json"}
 
 def q_start_export(survey_id: str) -> Tuple[str, str]:
     base = q_base_url(survey_id)
-    payload = {"format": "csv", "compress": True, "useLabels": True}
-    r = requests.post(base, headers=q_headers(), json=payload, timeout=60)
+    r = SESSION.post(base, headers=Q_HEADERS, json=Q_EXPORT_PAYLOAD, timeout=60)
     _raise_for_status(r, f"Qualtrics start export ({survey_id})")
-    progress_id = r.json()["result"]["progressId"]
+    progress_id = _json(r)["result"]["progressId"]
     return progress_id, base
 
 def q_poll_export(progress_id: str, base_url: str) -> str:
     waited = 0.0
-    interval = 2.0
+    delay = POLL_INITIAL_DELAY
     while True:
-        r = requests.get(f"{base_url}/{progress_id}", headers=q_headers(), timeout=60)
+        r = SESSION.get(f"{base_url}/{progress_id}", headers=Q_HEADERS, timeout=60)
         _raise_for_status(r, "Qualtrics poll export")
-        res = r.json()["result"]
+        res = _json(r)["result"]
         status = (res.get("status") or "").lower()
         pct = res.get("percentComplete", 0)
-        print(f"    Export progress: {pct}% ({status})")
+        print(f"    [{progress_id}] Export progress: {pct}% ({status})")
         if status == "complete":
             return res["fileId"]
         if status in {"failed", "error"}:
             raise RuntimeError(f"Qualtrics export failed: {res}")
-        time.sleep(interval)
-        waited += interval
-        if waited > 600:
+        time.sleep(delay)
+        waited += delay
+        delay = min(delay * POLL_BACKOFF_BASE, POLL_MAX_DELAY)
+        if waited > POLL_TIMEOUT:
             raise TimeoutError("Qualtrics export polling exceeded 10 minutes.")
 
-def q_download_zip(base_url: str, file_id: str) -> bytes:
-    r = requests.get(f"{base_url}/{file_id}/file", headers=q_headers(), timeout=300)
-    _raise_for_status(r, "Qualtrics download zip")
-    return r.content
+# Footer lines like {"ImportId":"finished"}; dropped before csv parsing so the
+# per-row cleaning loop doesn't have to look for them
+_FOOTER_RE = re.compile(r'\{[^\n]*"ImportId"')
 
-def extract_first_csv_text(zip_bytes: bytes) -> str:
-    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as z:
+def _csv_rows(f: IO[bytes]) -> Iterator[List[str]]:
+    """Decode a binary CSV stream and yield its rows, minus ImportId footer lines."""
+    text = io.TextIOWrapper(f, encoding="utf-8-sig", errors="replace", newline="")
+    yield from csv.reader(itertools.filterfalse(_FOOTER_RE.match, text))
+
+def extract_first_csv_rows(zip_file: IO[bytes]) -> Iterator[List[str]]:
+    """Yield parsed rows of the first CSV in a (seekable) ZIP file."""
+    with zipfile.ZipFile(zip_file) as z:
         for name in z.namelist():
             if name.lower().endswith(".csv"):
                 with z.open(name) as f:
-                    return f.read().decode("utf-8-sig", errors="replace")
+                    yield from _csv_rows(f)
+                return
     raise RuntimeError("No CSV found inside Qualtrics export ZIP.")
 
 
+# ---------- Streaming ZIP helpers ----------
+_ZIP_LOCAL_HEADER = struct.Struct("<4s5H3I2H")  # PK\x03\x04 local file header
+
+class _NotStreamable(Exception):
+    """ZIP layout the streaming reader doesn't handle; carries the bytes read so far."""
+    def __init__(self, head: bytes):
+        super().__init__("ZIP cannot be read as a stream")
+        self.head = head
+
+class _ChunkReader(io.RawIOBase):
+    """Read-only raw stream over an iterator of byte chunks."""
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._buf = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._buf:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._buf = memoryview(chunk)
+        n = min(len(b), len(self._buf))
+        b[:n] = self._buf[:n]
+        self._buf = self._buf[n:]
+        return n
+
+def _inflate_first_csv(zip_stream: IO[bytes]) -> Iterator[bytes]:
+    """
+    Yield the decompressed bytes of a ZIP's first member, read from its local
+    header so the central directory (at the end of the file) isn't needed.
+    Raises _NotStreamable before yielding anything unless that member is a
+    plain deflated .csv — the layout of Qualtrics exports.
+    """
+    head = zip_stream.read(_ZIP_LOCAL_HEADER.size)
+    if len(head) < _ZIP_LOCAL_HEADER.size:
+        raise _NotStreamable(head)
+    sig, _, flags, method, _, _, crc, _, _, name_len, extra_len = _ZIP_LOCAL_HEADER.unpack(head)
+    name_extra = zip_stream.read(name_len + extra_len)
+    head += name_extra
+    name = name_extra[:name_len].decode("utf-8" if flags & 0x800 else "cp437", errors="replace")
+    if (sig != b"PK\x03\x04" or method != zipfile.ZIP_DEFLATED or flags & 0x1
+            or not name.lower().endswith(".csv")):
+        raise _NotStreamable(head)
+
+    inflater = zlib.decompressobj(-zlib.MAX_WBITS)
+    actual_crc = 0
+    while not inflater.eof:
+        data = zip_stream.read1(ZIP_CHUNK_SIZE)
+        if not data:
+            raise zipfile.BadZipFile("Qualtrics export ZIP ended mid-stream.")
+        out = inflater.decompress(data)
+        if out:
+            actual_crc = zlib.crc32(out, actual_crc)
+            yield out
+
+    if flags & 0x8:
+        # CRC/sizes follow the data in a descriptor, optionally signed
+        tail = inflater.unused_data[:8]
+        tail += zip_stream.read(8 - len(tail))
+        crc = struct.unpack("<I", tail[4:8] if tail.startswith(b"PK\x07\x08") else tail[:4])[0]
+    if actual_crc != crc:
+        raise zipfile.BadZipFile(f"CRC mismatch in '{name}' of Qualtrics export ZIP.")
+
+def q_stream_csv_rows(base_url: str, file_id: str) -> Iterator[List[str]]:
+    """
+    Yield the export's CSV rows while the ZIP is still downloading: a
+    background thread pulls the body into a bounded queue, and this generator
+    inflates and parses chunks as they land. Archives that can't be streamed
+    are spooled to a temp file and read with zipfile instead.
+    """
+    with SESSION.get(f"{base_url}/{file_id}/file", headers=Q_HEADERS, timeout=300, stream=True) as r:
+        _raise_for_status(r, "Qualtrics download zip")
+        chunks: "queue.Queue" = queue.Queue(maxsize=ZIP_QUEUE_CHUNKS)
+        stop = threading.Event()
+
+        def download():
+            try:
+                for chunk in r.iter_content(ZIP_CHUNK_SIZE):
+                    if stop.is_set():
+                        return
+                    chunks.put(chunk)
+                chunks.put(None)
+            except Exception as e:
+                chunks.put(e)
+
+        def downloaded() -> Iterator[bytes]:
+            while True:
+                item = chunks.get()
+                if item is None:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+
+        t = threading.Thread(target=download, daemon=True)
+        t.start()
+        zip_stream = io.BufferedReader(_ChunkReader(downloaded()), ZIP_CHUNK_SIZE)
+        try:
+            try:
+                yield from _csv_rows(io.BufferedReader(_ChunkReader(_inflate_first_csv(zip_stream))))
+            except _NotStreamable as e:
+                with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as tmp:
+                    tmp.write(e.head)
+                    shutil.copyfileobj(zip_stream, tmp)
+                    tmp.seek(0)
+                    yield from extract_first_csv_rows(tmp)
+        finally:
+            # Let a producer blocked on a full queue see the stop flag
+            stop.set()
+            while t.is_alive():
+                try:
+                    chunks.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+
+
 # ---------- Cleaning & Parsing ----------
-def clean_keep_header_drop_2_3(csv_text: str) -> List[List[str]]:
+def clean_keep_header_drop_2_3(rows: Iterable[List[str]]) -> Iterator[List[str]]:
     """
-    Return cleaned CSV as list-of-rows:
+    Yield cleaned CSV rows in a single streaming pass:
       - Keep first *non-empty* row as header
       - Drop next two rows
-      - Remove footer lines like {"ImportId":"finished"}
       - Skip empty rows
+    (ImportId footers are already stripped by extract_first_csv_rows.)
     """
-    rows = list(csv.reader(io.StringIO(csv_text)))
-    header_idx = next((i for i, row in enumerate(rows) if any((c or "").strip() for c in row)), None)
-    if header_idx is None:
-        return []
-
-    drop = {header_idx + 1, header_idx + 2}
-
-    cleaned: List[List[str]] = []
-    for i, row in enumerate(rows):
-        if i in drop:
+    header_seen = False
+    skip = 0
+    for row in rows:
+        if not header_seen:
+            if any(c and c.strip() for c in row):
+                header_seen = True
+                skip = 2
+                yield row  # header
             continue
-        joined = " ".join((c or "") for c in row).strip()
-        if not joined or (joined.startswith("{") and "ImportId" in joined):
+        if skip:
+            skip -= 1
             continue
-        cleaned.append(row)
-
-    return cleaned  # includes header as first row
+        # any(row) runs in C and catches [] / all-"" rows; the first cell
+        # (StartDate) is normally filled, so whitespace-only rows rarely cost
+        # more than that
+        if not any(row) or (not row[0].strip() and not any(c.strip() for c in row)):
+            continue
+        yield row
 
 
-def rows_to_header_and_dicts(rows: List[List[str]]) -> Tuple[List[str], List[Dict[str, str]]]:
+def rows_to_header_and_columns(rows: Iterable[List[str]]) -> Tuple[List[str], List[Tuple[str, ...]]]:
     """
-    Convert parsed rows to (header, list_of_row_dicts).
+    Split parsed rows (header first) into (header, columns), transposing the
+    data rows into one tuple per header column (short rows padded with "").
     Empty header cells become unique column names like 'col_1' if needed.
     """
-    if not rows:
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
         return [], []
 
-    header = rows[0]
     # Normalize duplicate/blank headers
     normalized = []
     seen = {}
@@ -140,86 +328,196 @@ def rows_to_header_and_dicts(rows: List[List[str]]) -> Tuple[List[str], List[Dic
         normalized.append(candidate)
     header = normalized
 
-    dict_rows: List[Dict[str, str]] = []
-    for r in rows[1:]:
-        d = {}
-        for i, col in enumerate(header):
-            d[col] = r[i] if i < len(r) else ""
-        dict_rows.append(d)
-    return header, dict_rows
+    width = len(header)
+    data = [r if len(r) == width else (r + [""] * width)[:width] for r in rows]
+    columns = list(zip(*data)) if data else [()] * width
+    return header, columns
 
 
 # ---------- Merge helpers ----------
-def merge_tables(tables: List[Tuple[List[str], List[Dict[str, str]]]]) -> List[List[str]]:
+def merge_tables(tables: List[Tuple[List[str], List[Tuple[str, ...]]]]) -> Iterator[Sequence[str]]:
     """
-    Merge multiple (header, rows_as_dict) tables into one CSV rows list.
+    Merge multiple (header, columns) tables into one stream of CSV rows.
     Superset header preserves order of first appearance; new columns appended.
+    Each table is projected onto the superset by picking whole columns (blank
+    where a survey lacks one), and its rows are produced lazily by zip(), so
+    no merged copy of the data is ever built.
+    """
+    sup_header: List[str] = list(dict.fromkeys(col for hdr, _ in tables for col in hdr))
+
+    projected = []
+    for hdr, columns in tables:
+        # Missing columns point at a blank column appended after the real ones,
+        # so a single itemgetter call projects the whole table
+        pos = {name: i for i, name in enumerate(hdr)}
+        blank_idx = len(columns)
+        getter = operator.itemgetter(*[pos.get(col, blank_idx) for col in sup_header])
+        blank = ("",) * (len(columns[0]) if columns else 0)
+        cols = getter(columns + [blank])
+        projected.append(cols if len(sup_header) > 1 else (cols,))
+
+    return itertools.chain([sup_header], itertools.chain.from_iterable(zip(*cols) for cols in projected))
+
+
+def write_merged_csv(rows: Iterable[Sequence[str]], out_file: IO[bytes]):
+    """
+    Write rows as UTF-8 CSV into a binary file (left rewound for upload).
+    Cells are expected to be str already (csv-parsed), so the writer never
+    falls back to str() per cell.
     """
-    sup_header: List[str] = []
-    seen = set()
-    for hdr, _ in tables:
-        for col in hdr:
-            if col not in seen:
-                seen.add(col)
-                sup_header.append(col)
-
-    merged_rows: List[List[str]] = [sup_header]
-    for hdr, dict_rows in tables:
-        # Map each row dict to sup_header order
-        for d in dict_rows:
-            merged_rows.append([d.get(col, "") for col in sup_header])
-    return merged_rows
-
-
-def rows_to_csv_bytes(rows: List[List[str]]) -> bytes:
-    sio = io.StringIO()
-    writer = csv.writer(sio, lineterminator="\n")
+    writer = csv.writer(
+        codecs.getwriter("utf-8")(out_file),
+        lineterminator="\n",
+        quoting=csv.QUOTE_MINIMAL,
+        quotechar='"',
+        doublequote=True,
+    )
     writer.writerows(rows)
-    return sio.getvalue().encode("utf-8")
+    out_file.seek(0)
 
 
 # ---------- Box helpers ----------
 BOX_API_BASE = "https://api.box.com/2.0"
 BOX_UPLOAD_BASE = "https://upload.box.com/api/2.0"
+BOX_CHUNKED_UPLOAD_MIN = 20 * 1024 * 1024  # Box only allows upload sessions above 20 MB
+BOX_UPLOAD_WORKERS = 4  # parts sent at once in a chunked upload
+
+BOX_AUTH_HEADER = {"Authorization": f"Bearer {BOX_DEVELOPER_TOKEN}"}
+
+def box_search_file(folder_id: str, filename: str) -> Optional[str]:
+    """Look the file up through Box search (only matching metadata comes back)."""
+    params = {
+        "query": f'"{filename}"',  # quoted = exact match
+        "ancestor_folder_ids": folder_id,
+        "type": "file",
+        "content_types": "name",
+        "fields": "id,name,parent",
+    }
+    r = SESSION.get(f"{BOX_API_BASE}/search", headers=BOX_AUTH_HEADER, params=params, timeout=60)
+    _raise_for_status(r, "Box search")
+    for item in _json(r).get("entries", []):
+        # ancestor_folder_ids also matches subfolders
+        if item.get("name") == filename and (item.get("parent") or {}).get("id") == folder_id:
+            return item.get("id")
+    return None
 
-def box_auth_header() -> dict:
-    return {"Authorization": f"Bearer {BOX_DEVELOPER_TOKEN}"}
-
-def box_list_folder_items(folder_id: str, limit: int = 1000) -> list:
+def box_iter_folder_items(folder_id: str, limit: int = 1000) -> Iterator[dict]:
+    """Yield every item in the folder, following marker-based pagination."""
     url = f"{BOX_API_BASE}/folders/{folder_id}/items"
-    params = {"limit": limit, "offset": 0}
-    r = requests.get(url, headers=box_auth_header(), params=params, timeout=60)
-    _raise_for_status(r, "Box list folder items")
-    return r.json().get("entries", [])
+    params = {"limit": limit, "usemarker": "true", "fields": "type,name"}
+    while True:
+        r = SESSION.get(url, headers=BOX_AUTH_HEADER, params=params, timeout=60)
+        _raise_for_status(r, "Box list folder items")
+        page = _json(r)
+        yield from page.get("entries", [])
+        if not page.get("next_marker"):
+            return
+        params["marker"] = page["next_marker"]
 
 def box_find_file_in_folder_by_name(folder_id: str, filename: str) -> Optional[str]:
-    for item in box_list_folder_items(folder_id):
+    file_id = box_search_file(folder_id, filename)
+    if file_id:
+        return file_id
+    # Search indexing lags a few minutes behind uploads, so confirm a miss
+    # against the folder itself before creating a duplicate
+    for item in box_iter_folder_items(folder_id):
         if item.get("type") == "file" and item.get("name") == filename:
             return item.get("id")
     return None
 
-def box_upload_new_file(csv_bytes: bytes, filename: str, folder_id: str):
-    url = f"{BOX_UPLOAD_BASE}/files/content"
-    files = {
-        "attributes": (None, f'{{"name":"{filename}","parent":{{"id":"{folder_id}"}}}}', "application/json"),
-        "file": (filename, io.BytesIO(csv_bytes), "text/csv"),
-    }
-    r = requests.post(url, headers=box_auth_header(), files=files, timeout=300)
+def _sha1_digest(sha1) -> str:
+    return "sha=" + base64.b64encode(sha1.digest()).decode("ascii")
+
+def _file_size(f: IO[bytes]) -> int:
+    f.seek(0, io.SEEK_END)
+    size = f.tell()
+    f.seek(0)
+    return size
+
+def box_chunked_upload(csv_file: IO[bytes], filename: str, folder_id: str,
+                       file_id: Optional[str] = None) -> requests.Response:
+    """
+    Upload through a Box upload session, sending parts concurrently.
+    Creates a new file in folder_id, or a new version of file_id if given.
+    Returns the commit response, or the session response if Box refused it.
+    """
+    total = _file_size(csv_file)
+    if file_id:
+        url = f"{BOX_UPLOAD_BASE}/files/{file_id}/upload_sessions"
+        body = {"file_size": total, "file_name": filename}
+    else:
+        url = f"{BOX_UPLOAD_BASE}/files/upload_sessions"
+        body = {"folder_id": folder_id, "file_size": total, "file_name": filename}
+    r = SESSION.post(url, headers=BOX_AUTH_HEADER, json=body, timeout=60)
+    if not r.ok:
+        return r
+    session = _json(r)
+    endpoints = session["session_endpoints"]
+    part_size = session["part_size"]  # chosen by Box per session
+    read_lock = threading.Lock()  # workers share csv_file's position
+
+    def upload_part(offset: int) -> dict:
+        with read_lock:
+            csv_file.seek(offset)
+            chunk = csv_file.read(part_size)
+        headers = {
+            **BOX_AUTH_HEADER,
+            "Content-Type": "application/octet-stream",
+            "Content-Range": f"bytes {offset}-{offset + len(chunk) - 1}/{total}",
+            "Digest": _sha1_digest(hashlib.sha1(chunk)),
+        }
+        pr = SESSION.put(endpoints["upload_part"], headers=headers, data=chunk, timeout=300)
+        _raise_for_status(pr, "Box upload part")
+        return _json(pr)["part"]
+
+    print(f"    Chunked upload: {session['total_parts']} part(s) of {part_size} bytes")
+    try:
+        with ThreadPoolExecutor(max_workers=BOX_UPLOAD_WORKERS) as ex:
+            parts = list(ex.map(upload_part, range(0, total, part_size)))
+    except Exception:
+        SESSION.delete(endpoints["abort"], headers=BOX_AUTH_HEADER, timeout=60)
+        raise
+
+    sha1 = hashlib.sha1()
+    csv_file.seek(0)
+    for block in iter(lambda: csv_file.read(1 << 20), b""):
+        sha1.update(block)
+    headers = {**BOX_AUTH_HEADER, "Digest": _sha1_digest(sha1)}
+    while True:
+        r = SESSION.post(endpoints["commit"], headers=headers, json={"parts": parts}, timeout=300)
+        if r.status_code != 202:
+            return r
+        # Box is still processing the parts
+        time.sleep(int(r.headers.get("Retry-After", 1)))
+
+def _box_upload(csv_file: IO[bytes], filename: str, folder_id: str,
+                file_id: Optional[str] = None) -> requests.Response:
+    """Upload a new file (or a new version of file_id); chunked when large."""
+    if _file_size(csv_file) >= BOX_CHUNKED_UPLOAD_MIN:
+        return box_chunked_upload(csv_file, filename, folder_id, file_id)
+    if file_id:
+        url = f"{BOX_UPLOAD_BASE}/files/{file_id}/content"
+        files = {"file": (filename, csv_file, "text/csv")}
+    else:
+        url = f"{BOX_UPLOAD_BASE}/files/content"
+        files = {
+            "attributes": (None, f'{{"name":"{filename}","parent":{{"id":"{folder_id}"}}}}', "application/json"),
+            "file": (filename, csv_file, "text/csv"),
+        }
+    return SESSION.post(url, headers=BOX_AUTH_HEADER, files=files, timeout=300)
+
+def box_upload_new_file(csv_file: IO[bytes], filename: str, folder_id: str):
+    r = _box_upload(csv_file, filename, folder_id)
     _raise_for_status(r, "Box upload new file")
-    entry = r.json()["entries"][0]
+    entry = _json(r)["entries"][0]
     print(f"[✓] Uploaded new Box file '{entry['name']}' (id={entry['id']}).")
 
-def safe_overwrite_or_new(csv_bytes: bytes, filename: str, folder_id: str):
+def safe_overwrite_or_new(csv_file: IO[bytes], filename: str, folder_id: str):
     file_id = box_find_file_in_folder_by_name(folder_id, filename)
     if not file_id:
-        box_upload_new_file(csv_bytes, filename, folder_id)
+        box_upload_new_file(csv_file, filename, folder_id)
         return
-    r = requests.post(
-        f"{BOX_UPLOAD_BASE}/files/{file_id}/content",
-        headers=box_auth_header(),
-        files={"file": (filename, io.BytesIO(csv_bytes), "text/csv")},
-        timeout=300,
-    )
+    r = _box_upload(csv_file, filename, folder_id, file_id)
     if r.status_code == 201:
         print(f"[✓] Overwrote Box file '{filename}' with new version.")
         return
@@ -227,17 +525,21 @@ def safe_overwrite_or_new(csv_bytes: bytes, filename: str, folder_id: str):
         ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         alt = f"{filename.rsplit('.',1)[0]}_{ts}.csv"
         print(f"[warn] 403 overwrite denied → uploading as new file '{alt}'")
-        box_upload_new_file(csv_bytes, alt, folder_id)
+        box_upload_new_file(csv_file, alt, folder_id)
         return
     _raise_for_status(r, "Box upload new version")
 
 
-# ---------- Error helper ----------
+# ---------- Response helpers ----------
+def _json(resp: requests.Response):
+    """Parse a JSON response body (with orjson when available)."""
+    return _json_loads(resp.content)
+
 def _raise_for_status(resp: requests.Response, context: str):
     if resp.ok:
         return
     try:
-        j = resp.json()
+        j = _json(resp)
     except Exception:
         j = None
     msg = f"{context}: HTTP {resp.status_code}"
@@ -246,47 +548,56 @@ def _raise_for_status(resp: requests.Response, context: str):
 
 
 # ---------- Main ----------
+def process_survey(sid: str) -> Optional[Tuple[List[str], List[Tuple[str, ...]]]]:
+    """
+    Export, download, clean & parse one survey.
+    Returns (header, columns), or None if the export had no usable data.
+    """
+    pid, base_url = q_start_export(sid)
+    fid = q_poll_export(pid, base_url)
+    print(f"[+] {sid}: downloading, cleaning & parsing CSV…")
+    cleaned_rows = clean_keep_header_drop_2_3(q_stream_csv_rows(base_url, fid))
+    hdr, columns = rows_to_header_and_columns(cleaned_rows)
+    if not hdr:
+        print(f"[warn] {sid}: empty/invalid export; skipping.")
+        return None
+
+    print(f"[✓] {sid}: {len(columns[0])} row(s).")
+    return hdr, columns
+
+
 def main():
     survey_list = [s.strip() for s in SURVEY_IDS.split(",") if s.strip()]
     if not survey_list:
         raise SystemExit("No Survey IDs provided in SURVEY_IDS.")
 
-    tables: List[Tuple[List[str], List[Dict[str, str]]]] = []
-
-    for sid in survey_list:
-        print("\n===========================================")
-        print(f"[+] Processing survey: {sid}")
-        try:
-            pid, base_url = q_start_export(sid)
-            fid = q_poll_export(pid, base_url)
-            print("[+] Downloading export ZIP…")
-            zip_bytes = q_download_zip(base_url, fid)
-
-            print("[+] Cleaning & parsing CSV…")
-            csv_text = extract_first_csv_text(zip_bytes)
-            cleaned_rows = clean_keep_header_drop_2_3(csv_text)
-            if not cleaned_rows:
-                print(f"[warn] {sid}: empty/invalid export; skipping.")
+    print(f"[+] Processing {len(survey_list)} survey(s): {', '.join(survey_list)}")
+    results: Dict[str, Tuple[List[str], List[Tuple[str, ...]]]] = {}
+
+    # Exports are IO-bound (mostly waiting on Qualtrics), so run them side by side
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(survey_list))) as ex:
+        futures = {ex.submit(process_survey, sid): sid for sid in survey_list}
+        for fut in as_completed(futures):
+            sid = futures[fut]
+            try:
+                result = fut.result()
+            except Exception as e:
+                print(f"[error] {sid}: {e}")
                 continue
+            if result is not None:
+                results[sid] = result
 
-            hdr, dict_rows = rows_to_header_and_dicts(cleaned_rows)
-            if not hdr:
-                print(f"[warn] {sid}: no header detected; skipping.")
-                continue
-
-            tables.append((hdr, dict_rows))
-        except Exception as e:
-            print(f"[error] {sid}: {e}")
-
+    # Keep the input order so the superset header is stable between runs
+    tables = [results[sid] for sid in survey_list if sid in results]
     if not tables:
         raise SystemExit("No data collected from any survey; nothing to upload.")
 
     print("[+] Merging all surveys into one CSV…")
-    merged_rows = merge_tables(tables)
-    csv_bytes = rows_to_csv_bytes(merged_rows)
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as csv_file:
+        write_merged_csv(merge_tables(tables), csv_file)
 
-    print(f"[+] Uploading combined file to Box as '{CSV_FILENAME}'…")
-    safe_overwrite_or_new(csv_bytes, CSV_FILENAME, BOX_FOLDER_ID)
+        print(f"[+] Uploading combined file to Box as '{CSV_FILENAME}'…")
+        safe_overwrite_or_new(csv_file, CSV_FILENAME, BOX_FOLDER_ID)
 
     print("\n[✓] All done.")
 